@@ -0,0 +1,17 @@
+from flask import Flask
+from flask_cors import CORS
+import os
+
+
+def create_app(*blueprints):
+    app = Flask(__name__, static_folder="static", static_url_path="/static")
+    CORS(app)
+    app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
+    for blueprint in blueprints:
+        app.register_blueprint(blueprint)
+    return app
+
+
+def run(app):
+    port = int(os.environ.get("PORT", 5000))
+    app.run(host="0.0.0.0", port=port, debug=True)
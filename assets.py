@@ -0,0 +1,68 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+MODEL_PATH = Path("models/symptom_disease_model.pkl")
+MLB_PATH = Path("models/mlb.pkl")
+METADATA_PATH = Path("models/metadata.json")
+DESCRIPTION_CSV = Path("data/symptom_Description.csv")
+PRECAUTION_CSV = Path("data/symptom_precaution.csv")
+
+
+def build_metadata(mlb=None):
+    # Slow path: parse the CSVs with pandas. Only used at training time, or
+    # at runtime when the precompiled artifact has not been generated yet.
+    import pandas as pd
+
+    if mlb is None:
+        mlb = load_mlb()
+
+    desc_df = pd.read_csv(DESCRIPTION_CSV)
+    disease_to_description = dict(zip(desc_df["Disease"], desc_df["Description"]))
+
+    pre_df = pd.read_csv(PRECAUTION_CSV).fillna("")
+    disease_to_precautions = {}
+    for _, row in pre_df.iterrows():
+        disease = row["Disease"]
+        vals = [
+            str(row.get("Precaution_1", "")).strip(),
+            str(row.get("Precaution_2", "")).strip(),
+            str(row.get("Precaution_3", "")).strip(),
+            str(row.get("Precaution_4", "")).strip(),
+        ]
+        disease_to_precautions[disease] = [v for v in vals if v]
+
+    return {
+        "symptoms": [str(s) for s in mlb.classes_],
+        "descriptions": disease_to_description,
+        "precautions": disease_to_precautions,
+    }
+
+
+def write_metadata(metadata, path: Path = METADATA_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(metadata, fh, separators=(",", ":"), ensure_ascii=False)
+
+
+@lru_cache(maxsize=None)
+def load_metadata():
+    try:
+        with open(METADATA_PATH, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return build_metadata()
+
+
+@lru_cache(maxsize=None)
+def load_model():
+    import joblib
+
+    return joblib.load(MODEL_PATH)
+
+
+@lru_cache(maxsize=None)
+def load_mlb():
+    import joblib
+
+    return joblib.load(MLB_PATH)
@@ -0,0 +1,77 @@
+"""Import-time report for the server entry points.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter for
+each entry point and summarises the result, so startup regressions (a heavy
+library creeping back into module scope) show up as a jump in the numbers.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --top 15 --budget-ms 300 web_server
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MODULES = ["web_server", "inference_server", "server"]
+HEAVY_MODULES = ["pandas", "numpy", "sklearn", "joblib", "requests"]
+
+
+def measure(module, repeat=3):
+    # Best of `repeat` runs; each line of -X importtime output looks like
+    # "import time:   self [us] | cumulative | imported package".
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing {module} failed:\n{proc.stderr}")
+        rows = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+        total = next(cum for name, _, cum in rows if name.strip() == module)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    return best
+
+
+def report(module, total_us, rows, top):
+    loaded = {name.strip().split(".")[0] for name, _, _ in rows}
+    heavy = [m for m in HEAVY_MODULES if m in loaded]
+    print(f"{module}: {total_us / 1000:.1f} ms, {len(rows)} modules")
+    print(f"  heavy imports: {', '.join(heavy) if heavy else 'none'}")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms cumulative {self_us / 1000:8.1f} ms self  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per module")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module, best is reported")
+    parser.add_argument("--budget-ms", type=float, help="exit non-zero if any module exceeds this")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in args.modules:
+        total_us, rows = measure(module, args.repeat)
+        report(module, total_us, rows, args.top)
+        if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"over {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from flask import Blueprint, jsonify, request
+
+from assets import load_metadata, load_mlb, load_model
+
+inference = Blueprint("inference", __name__)
+
+
+@inference.route("/api/symptoms", methods=["GET"])
+def get_symptoms():
+    return jsonify({
+        "symptoms": load_metadata()["symptoms"]
+    })
+
+
+@inference.route("/api/predict", methods=["POST"])
+def predict():
+    import numpy as np
+
+    payload = request.json or {}
+    symptoms = payload.get("symptoms", [])
+    top_k = int(payload.get("top_k", 3))
+
+    if not symptoms:
+        return jsonify({"error": "symptoms list is required"}), 400
+
+    model = load_model()
+    metadata = load_metadata()
+    d2desc = metadata["descriptions"]
+    d2pre = metadata["precautions"]
+
+    X = load_mlb().transform([symptoms])
+    try:
+        proba = model.predict_proba(X)[0]
+        classes = getattr(model, "classes_", None)
+        if classes is None:
+            classes = np.unique(model.predict(X))
+    except Exception:
+        pred = model.predict(X)
+        classes = np.array([pred[0]])
+        proba = np.array([1.0])
+
+    order = np.argsort(proba)[::-1]
+    top_indices = order[:top_k]
+    top = []
+    for i in top_indices:
+        disease = str(classes[i])
+        top.append({
+            "disease": disease,
+            "confidence": float(proba[i]),
+            "description": d2desc.get(disease, "Description not available."),
+            "precautions": d2pre.get(disease, []),
+        })
+
+    return jsonify({
+        "predictions": top
+    })
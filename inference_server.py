@@ -0,0 +1,10 @@
+# Slim entry point: /api/symptoms and /api/predict only. The model is loaded
+# on the first /api/predict request.
+from app_factory import create_app, run
+from inference_routes import inference
+
+app = create_app(inference)
+
+
+if __name__ == "__main__":
+    run(app)
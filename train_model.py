@@ -3,6 +3,7 @@ from sklearn.preprocessing import MultiLabelBinarizer
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 import joblib
+from assets import build_metadata, write_metadata
 
 # Load dataset
 df = pd.read_csv("data/dataset.csv")
@@ -29,4 +30,8 @@ model.fit(X_train, y_train)
 joblib.dump(model, "models/symptom_disease_model.pkl")
 joblib.dump(mlb, "models/mlb.pkl")
 
+# Precompile disease descriptions/precautions and the symptom list so the
+# server can start without pandas
+write_metadata(build_metadata(mlb))
+
 print("Model trained and saved successfully!")
\ No newline at end of file
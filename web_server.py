@@ -0,0 +1,9 @@
+# Slim entry point: static pages, auth and tracking. Never loads the model.
+from app_factory import create_app, run
+from web_routes import web
+
+app = create_app(web)
+
+
+if __name__ == "__main__":
+    run(app)